@@ -2,22 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 
-from .const import CONF_DEVICE_ADDRESS, CONF_DEVICE_NAME, DOMAIN
+from .const import (
+    CONF_DEVICE_ADDRESS,
+    CONF_DEVICE_NAME,
+    DEFAULT_UPDATE_INTERVAL,
+    FIRST_REFRESH_ATTEMPTS,
+    FIRST_REFRESH_BASE_DELAY,
+)
 from .coordinator import LitimeBmsCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [
+PLATFORMS: tuple[Platform, ...] = (
     Platform.SENSOR,
     Platform.BINARY_SENSOR,
     Platform.SWITCH,
-]
+)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -25,7 +32,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     address: str = entry.data[CONF_DEVICE_ADDRESS]
     name: str = entry.data.get(CONF_DEVICE_NAME, address)
 
-    coordinator = LitimeBmsCoordinator(hass, address, name)
+    coordinator = LitimeBmsCoordinator(
+        hass, address, name, entry.unique_id or entry.entry_id
+    )
 
     # BLE devices may not be reachable at startup. Set up the integration
     # immediately and let the coordinator retry in the background.
@@ -35,13 +44,34 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Schedule the first refresh in the background - will retry on its
-    # update_interval if the device is not reachable yet.
-    await coordinator.async_request_refresh()
+    # Run the first refresh in the background so setup returns immediately.
+    # It retries with exponential backoff while the device is not reachable;
+    # after that the coordinator keeps polling on its update_interval.
+    entry.async_create_background_task(
+        hass, _async_first_refresh(coordinator), "litime_first_refresh"
+    )
 
     return True
 
 
+async def _async_first_refresh(coordinator: LitimeBmsCoordinator) -> None:
+    """Refresh until the BMS responds, backing off between attempts."""
+    for attempt in range(FIRST_REFRESH_ATTEMPTS):
+        await coordinator.async_refresh()
+        # Failed polls still succeed with offline data, so check "online"
+        data = coordinator.data
+        if not coordinator.connection_enabled or (data and data.get("online")):
+            return
+        if attempt + 1 < FIRST_REFRESH_ATTEMPTS:
+            delay = min(
+                FIRST_REFRESH_BASE_DELAY * 2**attempt, DEFAULT_UPDATE_INTERVAL
+            )
+            _LOGGER.debug(
+                "%s not reachable yet, retrying in %.0fs", coordinator.address, delay
+            )
+            await asyncio.sleep(delay)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -2,9 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Any
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -16,7 +14,6 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
 from .coordinator import LitimeBmsCoordinator
 
 
@@ -24,33 +21,27 @@ from .coordinator import LitimeBmsCoordinator
 class LitimeBinarySensorEntityDescription(BinarySensorEntityDescription):
     """Description of a LiTime binary sensor entity."""
 
-    value_fn: Callable[[dict[str, Any]], bool | None]
-
 
 BINARY_SENSOR_DESCRIPTIONS: tuple[LitimeBinarySensorEntityDescription, ...] = (
     LitimeBinarySensorEntityDescription(
         key="charging",
         translation_key="charging",
         icon="mdi:battery-charging",
-        value_fn=lambda data: data.get("charging"),
     ),
     LitimeBinarySensorEntityDescription(
         key="discharging",
         translation_key="discharging",
         icon="mdi:battery-arrow-down-outline",
-        value_fn=lambda data: data.get("discharging"),
     ),
     LitimeBinarySensorEntityDescription(
         key="balancing",
         translation_key="balancing",
         icon="mdi:battery-sync",
-        value_fn=lambda data: data.get("balancing"),
     ),
     LitimeBinarySensorEntityDescription(
         key="online",
         translation_key="online",
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
-        value_fn=lambda data: data.get("online"),
     ),
 )
 
@@ -62,9 +53,12 @@ async def async_setup_entry(
 ) -> None:
     """Set up LiTime BMS binary sensors."""
     coordinator: LitimeBmsCoordinator = entry.runtime_data
+    unique_id_prefix = entry.unique_id
 
     async_add_entities(
-        LitimeBinarySensorEntity(coordinator, description, entry)
+        LitimeBinarySensorEntity(
+            coordinator, description, f"{unique_id_prefix}_{description.key}"
+        )
         for description in BINARY_SENSOR_DESCRIPTIONS
     )
 
@@ -81,26 +75,22 @@ class LitimeBinarySensorEntity(
         self,
         coordinator: LitimeBmsCoordinator,
         description: LitimeBinarySensorEntityDescription,
-        entry: ConfigEntry,
+        unique_id: str,
     ) -> None:
         """Initialize the binary sensor."""
         super().__init__(coordinator)
         self.entity_description = description
-        self._attr_unique_id = f"{entry.unique_id}_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.unique_id or entry.entry_id)},
-            "name": coordinator.device_name,
-            "manufacturer": "LiTime",
-            "model": "LiFePO4 BMS",
-            "connections": {("bluetooth", coordinator.address)},
-        }
+        # Descriptions are keyed by their coordinator data key
+        self._data_key = description.key
+        self._is_online_sensor = description.key == "online"
+        self._attr_unique_id = unique_id
+        self._attr_device_info = coordinator.device_info
 
     @property
     def is_on(self) -> bool | None:
         """Return the binary sensor state."""
-        if self.coordinator.data is None:
-            return None
-        return self.entity_description.value_fn(self.coordinator.data)
+        data = self.coordinator.data
+        return None if data is None else data.get(self._data_key)
 
     @property
     def available(self) -> bool:
@@ -108,8 +98,7 @@ class LitimeBinarySensorEntity(
         if not super().available:
             return False
         # Online sensor is always available when coordinator is available
-        if self.entity_description.key == "online":
+        if self._is_online_sensor:
             return True
-        if self.coordinator.data is None:
-            return False
-        return self.coordinator.data.get("online", False)
+        data = self.coordinator.data
+        return data is not None and data.get("online", False)
@@ -26,7 +26,8 @@ class LitimeBmsConfigFlow(ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         """Initialize the config flow."""
         self._discovered_devices: dict[str, str] = {}
-        self._discovery_info: BluetoothServiceInfoBleak | None = None
+        self._title = ""
+        self._entry_data: dict[str, str] = {}
 
     async def async_step_bluetooth(
         self, discovery_info: BluetoothServiceInfoBleak
@@ -37,35 +38,33 @@ class LitimeBmsConfigFlow(ConfigFlow, domain=DOMAIN):
             discovery_info.name,
             discovery_info.address,
         )
-        await self.async_set_unique_id(discovery_info.address.upper())
+        address = discovery_info.address.upper()
+        # Cheap membership check before the exception-based abort path
+        if address in self._async_current_ids():
+            return self.async_abort(reason="already_configured")
+        await self.async_set_unique_id(address)
         self._abort_if_unique_id_configured()
 
-        self._discovery_info = discovery_info
-        self.context["title_placeholders"] = {
-            "name": discovery_info.name or discovery_info.address
+        title = discovery_info.name or discovery_info.address
+        self._title = title
+        self._entry_data = {
+            CONF_DEVICE_ADDRESS: discovery_info.address,
+            CONF_DEVICE_NAME: title,
         }
+        self.context["title_placeholders"] = {"name": title}
         return await self.async_step_bluetooth_confirm()
 
     async def async_step_bluetooth_confirm(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Confirm discovery of a LiTime BMS device."""
-        assert self._discovery_info is not None
-        title = self._discovery_info.name or self._discovery_info.address
-
         if user_input is not None:
-            return self.async_create_entry(
-                title=title,
-                data={
-                    CONF_DEVICE_ADDRESS: self._discovery_info.address,
-                    CONF_DEVICE_NAME: title,
-                },
-            )
+            return self.async_create_entry(title=self._title, data=self._entry_data)
 
         self._set_confirm_only()
         return self.async_show_form(
             step_id="bluetooth_confirm",
-            description_placeholders={"name": title},
+            description_placeholders={"name": self._title},
         )
 
     async def async_step_user(
@@ -73,26 +72,30 @@ class LitimeBmsConfigFlow(ConfigFlow, domain=DOMAIN):
     ) -> ConfigFlowResult:
         """Handle the user step to pick discovered device."""
         if user_input is not None:
+            # Submission of the form rendered below; the devices were already
+            # scanned then, so do not walk the Bluetooth cache again.
             address = user_input[CONF_DEVICE_ADDRESS]
+            name = self._discovered_devices[address]
             await self.async_set_unique_id(address.upper(), raise_on_progress=False)
             self._abort_if_unique_id_configured()
             return self.async_create_entry(
-                title=self._discovered_devices[address],
+                title=name,
                 data={
                     CONF_DEVICE_ADDRESS: address,
-                    CONF_DEVICE_NAME: self._discovered_devices[address],
+                    CONF_DEVICE_NAME: name,
                 },
             )
 
-        current_addresses = self._async_current_ids()
-        for info in async_discovered_service_info(self.hass, False):
-            address = info.address
-            if address in current_addresses or address in self._discovered_devices:
-                continue
-            if info.name and any(
-                info.name.startswith(prefix) for prefix in DEVICE_NAME_PREFIXES
-            ):
-                self._discovered_devices[address] = info.name
+        # Scan once per flow; form re-renders reuse the devices found
+        if not self._discovered_devices:
+            current_addresses = frozenset(self._async_current_ids())
+            seen = self._discovered_devices
+            for info in async_discovered_service_info(self.hass, False):
+                address = info.address
+                if address in current_addresses or address in seen:
+                    continue
+                if info.name and info.name.startswith(DEVICE_NAME_PREFIXES):
+                    seen[address] = info.name
 
         if not self._discovered_devices:
             return self.async_abort(reason="no_devices_found")
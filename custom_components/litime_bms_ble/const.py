@@ -9,7 +9,8 @@ SERVICE_UUID = "0000ffe0-0000-1000-8000-00805f9b34fb"
 NOTIFY_CHAR_UUID = "0000ffe1-0000-1000-8000-00805f9b34fb"
 WRITE_CHAR_UUID = "0000ffe2-0000-1000-8000-00805f9b34fb"
 
-# BLE device name prefixes for discovery
+# BLE device name prefixes for discovery (case-sensitive; kept as a tuple so
+# it can be passed to str.startswith directly)
 DEVICE_NAME_PREFIXES = ("LT-", "L-")
 
 # Command IDs (8-byte frame: {0x00, 0x00, 0x04, 0x01, CMD, 0x55, 0xAA, CHECKSUM})
@@ -64,6 +65,12 @@ DEFAULT_UPDATE_INTERVAL = 30
 # Max missed updates before marking offline
 MAX_MISSED_UPDATES = 5
 
+# First refresh after setup: attempts and base delay in seconds, doubled after
+# each failed attempt (1, 2, 4, 8, 16s) so a BMS that wakes up shortly after
+# Home Assistant starts is picked up before the regular update interval
+FIRST_REFRESH_ATTEMPTS = 6
+FIRST_REFRESH_BASE_DELAY = 1.0
+
 # Config keys
 CONF_DEVICE_ADDRESS = "device_address"
 CONF_DEVICE_NAME = "device_name"
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from array import array
 import asyncio
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 import logging
 import struct
 from typing import Any
@@ -14,6 +16,7 @@ from bleak_retry_connector import establish_connection
 
 from homeassistant.components import bluetooth
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import (
@@ -42,6 +45,46 @@ _LOGGER = logging.getLogger(__name__)
 RESPONSE_MARKER_OFFSET = 2
 RESPONSE_MARKER_VALUE = 0x65
 
+# Preallocated reassembly buffer size: a full status frame plus one fragment
+RESPONSE_BUFFER_SIZE = MIN_RESPONSE_LENGTH + 32
+
+# Status fields from byte 12 up to MIN_RESPONSE_LENGTH, decoded in one call.
+# Pad bytes (x) skip the unused ranges 56-61, 66-67, 72-75 and 94-95.
+STATUS_OFFSET = 12
+_STATUS_STRUCT = struct.Struct(f"<I{MAX_CELLS}Hihh6xHH2xI4xIIIHHH2xII")
+
+_NAN = float("nan")
+
+# Coordinator data while the BMS is unreachable or the connection is disabled
+_OFFLINE_CELLS: tuple[None, ...] = (None,) * MAX_CELLS
+_OFFLINE_DATA: dict[str, Any] = {
+    "online": False,
+    "total_voltage": None,
+    "current": None,
+    "power": None,
+    "state_of_charge": None,
+    "state_of_health": None,
+    "cell_temperature": None,
+    "mosfet_temperature": None,
+    "remaining_capacity": None,
+    "full_charge_capacity": None,
+    "discharge_cycles": None,
+    "total_discharge_ah": None,
+    "min_cell_voltage": None,
+    "max_cell_voltage": None,
+    "delta_cell_voltage": None,
+    "cell_voltages": _OFFLINE_CELLS,
+    "charging": None,
+    "discharging": None,
+    "balancing": None,
+    "charge_enabled": None,
+    "discharge_enabled": None,
+    "protection_status": None,
+    "failure_status": None,
+    "estimate_15_soc_time": None,
+    "remaining_time_hours": None,
+}
+
 
 def _build_command(cmd: int) -> bytes:
     """Build an 8-byte command frame.
@@ -53,17 +96,35 @@ def _build_command(cmd: int) -> bytes:
     return bytes([0x00, 0x00, 0x04, 0x01, cmd, 0x55, 0xAA, checksum & 0xFF])
 
 
+# Prebuilt frames for the commands sent by the coordinator
+_FRAMES: dict[int, bytes] = {
+    cmd: _build_command(cmd)
+    for cmd in (
+        CMD_QUERY_STATUS,
+        CMD_CHARGE_ON,
+        CMD_CHARGE_OFF,
+        CMD_DISCHARGE_ON,
+        CMD_DISCHARGE_OFF,
+    )
+}
+
+
+_PROTECTION_ITEMS: tuple[tuple[int, str], ...] = tuple(PROTECTION_FLAGS.items())
+
+
 def _decode_protection_flags(flags: int) -> str:
     """Decode protection flags to human-readable string."""
     if flags == 0:
         return "OK"
-    parts = []
-    for flag_val, flag_name in PROTECTION_FLAGS.items():
-        if flags & flag_val:
-            parts.append(flag_name)
-    return ", ".join(parts) if parts else "OK"
+    return (
+        ", ".join(
+            flag_name for flag_val, flag_name in _PROTECTION_ITEMS if flags & flag_val
+        )
+        or "OK"
+    )
 
 
+@lru_cache(maxsize=32)
 def _decode_failure_flags(flags: int) -> str:
     """Decode failure flags to human-readable string."""
     if flags == 0:
@@ -71,90 +132,95 @@ def _decode_failure_flags(flags: int) -> str:
     return f"Error: 0x{flags:08X}"
 
 
-def _parse_status_response(data: bytes) -> dict[str, Any]:
+def _parse_status_response(data: bytes | bytearray | memoryview) -> dict[str, Any]:
     """Parse status response from the BMS.
 
     Offsets are based on the raw BLE notification data (verified against
     the working ESPHome YAML configuration). All multi-byte values are
-    little-endian.
+    little-endian. Any buffer is accepted, so the reassembled frame can be
+    parsed without copying it to bytes first.
     """
     if len(data) < MIN_RESPONSE_LENGTH:
         raise ValueError(
             f"Response too short: {len(data)} bytes, expected >= {MIN_RESPONSE_LENGTH}"
         )
 
+    (
+        total_voltage_mv,
+        *cells_raw,
+        current_ma,
+        cell_temperature,
+        mosfet_temperature,
+        remaining_capacity_raw,
+        full_charge_capacity_raw,
+        heat_state,
+        protection_flags,
+        failure_flags,
+        balancing_state,
+        battery_state,
+        state_of_charge,
+        state_of_health,
+        discharge_cycles,
+        total_discharge_mah,
+    ) = _STATUS_STRUCT.unpack_from(data, STATUS_OFFSET)
+
     result: dict[str, Any] = {}
 
     # Total voltage (bytes 12-15, uint32_le, mV -> V)
-    total_voltage = struct.unpack_from("<I", data, 12)[0] / 1000.0
+    total_voltage = total_voltage_mv / 1000.0
     result["total_voltage"] = total_voltage
 
     # Individual cell voltages (bytes 16-47, 16x uint16_le, mV -> V)
-    min_cell = 99.0
-    max_cell = 0.0
-    cell_count = 0
-    cell_voltages: list[float | None] = [None] * MAX_CELLS
-
-    for i in range(MAX_CELLS):
-        raw = struct.unpack_from("<H", data, 16 + i * 2)[0]
-        if raw == 0:
-            continue
-        cell_v = raw / 1000.0
-        cell_voltages[i] = cell_v
-        cell_count += 1
-        if cell_v < min_cell:
-            min_cell = cell_v
-        if cell_v > max_cell:
-            max_cell = cell_v
-
-    result["cell_voltages"] = cell_voltages
-
-    if cell_count > 0:
-        result["min_cell_voltage"] = min_cell
-        result["max_cell_voltage"] = max_cell
-        result["delta_cell_voltage"] = round(max_cell - min_cell, 3)
+    # Stored as a compact array of doubles, NaN for unpopulated cells
+    result["cell_voltages"] = array(
+        "d", [raw / 1000.0 if raw else _NAN for raw in cells_raw]
+    )
+
+    present_cells = [raw for raw in cells_raw if raw]
+    if present_cells:
+        min_cell_mv = min(present_cells)
+        max_cell_mv = max(present_cells)
+        result["min_cell_voltage"] = min_cell_mv / 1000.0
+        result["max_cell_voltage"] = max_cell_mv / 1000.0
+        # Subtracting in mV keeps the delta exact without rounding
+        result["delta_cell_voltage"] = (max_cell_mv - min_cell_mv) / 1000.0
     else:
         result["min_cell_voltage"] = None
         result["max_cell_voltage"] = None
         result["delta_cell_voltage"] = None
 
     # Current (bytes 48-51, int32_le, mA -> A)
-    current = struct.unpack_from("<i", data, 48)[0] / 1000.0
+    current = current_ma / 1000.0
     result["current"] = current
 
-    # Power (calculated)
-    result["power"] = round(total_voltage * current, 1)
+    # Power (calculated, display rounding via suggested_display_precision)
+    result["power"] = total_voltage * current
 
     # Cell temperature (bytes 52-53, int16_le, degrees C)
-    result["cell_temperature"] = struct.unpack_from("<h", data, 52)[0]
+    result["cell_temperature"] = cell_temperature
 
     # MOSFET temperature (bytes 54-55, int16_le, degrees C)
-    result["mosfet_temperature"] = struct.unpack_from("<h", data, 54)[0]
+    result["mosfet_temperature"] = mosfet_temperature
 
     # Remaining capacity (bytes 62-63, uint16_le, x0.01 Ah -> Ah)
-    result["remaining_capacity"] = struct.unpack_from("<H", data, 62)[0] / 100.0
+    result["remaining_capacity"] = remaining_capacity_raw / 100.0
 
     # Full charge capacity (bytes 64-65, uint16_le, x0.01 Ah -> Ah)
-    result["full_charge_capacity"] = struct.unpack_from("<H", data, 64)[0] / 100.0
+    result["full_charge_capacity"] = full_charge_capacity_raw / 100.0
 
     # Heat state (bytes 68-71, uint32_le) - bit 0x80 = discharge disabled
-    heat_state = struct.unpack_from("<I", data, 68)[0]
     result["discharge_enabled"] = not bool(heat_state & 0x00000080)
 
     # Protection state (bytes 76-79, uint32_le)
-    protection_flags = struct.unpack_from("<I", data, 76)[0]
     result["protection_status"] = _decode_protection_flags(protection_flags)
 
     # Failure state (bytes 80-83, uint32_le)
-    failure_flags = struct.unpack_from("<I", data, 80)[0]
     result["failure_status"] = _decode_failure_flags(failure_flags)
 
     # Balancing state (bytes 84-87, uint32_le)
-    balancing_state = struct.unpack_from("<I", data, 84)[0]
     result["balancing"] = balancing_state != 0
 
     # Battery state (bytes 88-89, uint16_le)
-    battery_state = struct.unpack_from("<H", data, 88)[0]
     result["charging"] = battery_state == BATTERY_STATE_CHARGING
     result["discharging"] = (
         battery_state == BATTERY_STATE_DISCHARGING and current < 0
@@ -162,16 +228,16 @@ def _parse_status_response(data: bytes) -> dict[str, Any]:
     result["charge_enabled"] = battery_state != BATTERY_STATE_CHARGE_DISABLED
 
     # SOC (bytes 90-91, uint16_le, %)
-    result["state_of_charge"] = struct.unpack_from("<H", data, 90)[0]
+    result["state_of_charge"] = state_of_charge
 
     # SOH (bytes 92-93, uint16_le, %)
-    result["state_of_health"] = struct.unpack_from("<H", data, 92)[0]
+    result["state_of_health"] = state_of_health
 
     # Discharge cycle count (bytes 96-99, uint32_le)
-    result["discharge_cycles"] = struct.unpack_from("<I", data, 96)[0]
+    result["discharge_cycles"] = discharge_cycles
 
     # Total discharge Ah (bytes 100-103, uint32_le, mAh -> Ah)
-    result["total_discharge_ah"] = struct.unpack_from("<I", data, 100)[0] / 1000.0
+    result["total_discharge_ah"] = total_discharge_mah / 1000.0
 
     # Estimated time to reach 15% SOC (or full charge if charging)
     remaining_cap = result["remaining_capacity"]
@@ -208,6 +274,7 @@ class LitimeBmsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         hass: HomeAssistant,
         address: str,
         name: str,
+        device_id: str,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
@@ -218,11 +285,22 @@ class LitimeBmsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         )
         self.address = address
         self._device_name = name
+        # Shared by all entities of this device; Home Assistant only reads it
+        self._device_info: DeviceInfo = {
+            "identifiers": {(DOMAIN, device_id)},
+            "name": name,
+            "manufacturer": "LiTime",
+            "model": "LiFePO4 BMS",
+            "connections": {("bluetooth", address)},
+        }
         self._client: BleakClient | None = None
         self._write_char: BleakGATTCharacteristic | None = None
         self._notify_char: BleakGATTCharacteristic | None = None
-        self._response_buffer = bytearray()
-        self._response_data: bytes | None = None
+        self._response_buffer = bytearray(RESPONSE_BUFFER_SIZE)
+        self._response_len = 0
+        self._response_data: memoryview | None = None
+        self._last_response: memoryview | None = None
+        self._last_parsed_at = datetime.now(timezone.utc)
         self._response_event = asyncio.Event()
         self._missed_updates = 0
         self._connected = False
@@ -233,6 +311,11 @@ class LitimeBmsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Return the device name."""
         return self._device_name
 
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return the device info shared by all entities."""
+        return self._device_info
+
     @property
     def connection_enabled(self) -> bool:
         """Return whether the connection is enabled."""
@@ -242,37 +325,35 @@ class LitimeBmsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self, characteristic: BleakGATTCharacteristic, data: bytearray
     ) -> None:
         """Handle BLE notification data."""
-        _LOGGER.debug(
-            "Notification: %d bytes, hex=%s",
-            len(data),
-            data.hex(),
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            # data.hex() would be evaluated even with debug logging disabled
+            _LOGGER.debug("Notification: %d bytes, hex=%s", len(data), data.hex())
 
         # Check for response marker at byte[2] == 0x65
         if len(data) > RESPONSE_MARKER_OFFSET and data[RESPONSE_MARKER_OFFSET] == RESPONSE_MARKER_VALUE:
             # This is a status response - could arrive in one packet or fragmented
-            self._response_buffer = bytearray(data)
+            start = 0
+        elif self._response_len > 0:
+            # Continuation fragment
+            start = self._response_len
         else:
-            # Continuation fragment or non-status packet
-            if len(self._response_buffer) > 0:
-                self._response_buffer.extend(data)
-            else:
-                _LOGGER.debug("Ignoring non-status notification (%d bytes)", len(data))
-                return
+            _LOGGER.debug("Ignoring non-status notification (%d bytes)", len(data))
+            return
 
-        if len(self._response_buffer) >= MIN_RESPONSE_LENGTH:
-            _LOGGER.debug(
-                "Complete response: %d bytes", len(self._response_buffer)
-            )
-            self._response_data = bytes(self._response_buffer)
-            self._response_buffer.clear()
+        # Write into the preallocated buffer (only grows for oversized frames)
+        end = start + len(data)
+        self._response_buffer[start:end] = data
+        self._response_len = end
+
+        if end >= MIN_RESPONSE_LENGTH:
+            _LOGGER.debug("Complete response: %d bytes", end)
+            # Hand the buffer over to the parser instead of copying it
+            self._response_data = memoryview(self._response_buffer)[:end]
+            self._response_buffer = bytearray(RESPONSE_BUFFER_SIZE)
+            self._response_len = 0
             self._response_event.set()
         else:
-            _LOGGER.debug(
-                "Buffered %d/%d bytes",
-                len(self._response_buffer),
-                MIN_RESPONSE_LENGTH,
-            )
+            _LOGGER.debug("Buffered %d/%d bytes", end, MIN_RESPONSE_LENGTH)
 
     async def _ensure_connected(self) -> bool:
         """Ensure BLE connection is established."""
@@ -385,14 +466,15 @@ class LitimeBmsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.warning("Cannot send command, not connected")
             return
 
-        frame = _build_command(cmd)
-        _LOGGER.debug(
-            "Sending command 0x%02X to %s (%d bytes, hex=%s)",
-            cmd,
-            self._write_char.uuid,
-            len(frame),
-            frame.hex(),
-        )
+        frame = _FRAMES.get(cmd) or _build_command(cmd)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Sending command 0x%02X to %s (%d bytes, hex=%s)",
+                cmd,
+                self._write_char.uuid,
+                len(frame),
+                frame.hex(),
+            )
         try:
             # Use write-without-response if supported, otherwise write-with-response
             use_response = "write-without-response" not in self._write_char.properties
@@ -426,7 +508,7 @@ class LitimeBmsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Reset event, buffer and send status query
         self._response_event.clear()
         self._response_data = None
-        self._response_buffer.clear()
+        self._response_len = 0
 
         try:
             await self._send_command(CMD_QUERY_STATUS)
@@ -446,7 +528,7 @@ class LitimeBmsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.warning(
                 "Timeout waiting for response from %s (buffer has %d bytes)",
                 self.address,
-                len(self._response_buffer),
+                self._response_len,
             )
             self._missed_updates += 1
             return self._offline_data()
@@ -455,9 +537,30 @@ class LitimeBmsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.warning("No response data received from %s", self.address)
             return self._offline_data()
 
+        last_data = self.data
+        if (
+            self._response_data == self._last_response
+            and last_data is not None
+            and last_data.get("online")
+        ):
+            # Unchanged frame: reuse the previous result and only move the
+            # time estimate along with the clock
+            self._missed_updates = 0
+            estimate = last_data["estimate_15_soc_time"]
+            if estimate is None:
+                return last_data
+            now = datetime.now(timezone.utc)
+            result = dict(last_data)
+            result["estimate_15_soc_time"] = estimate + (now - self._last_parsed_at)
+            self._last_parsed_at = now
+            return result
+
         try:
             result = _parse_status_response(self._response_data)
             self._missed_updates = 0
+            # The handed-over buffer is never written again, so keep it as is
+            self._last_response = self._response_data
+            self._last_parsed_at = datetime.now(timezone.utc)
             return result
         except (ValueError, struct.error) as err:
             _LOGGER.warning("Failed to parse response from %s: %s", self.address, err)
@@ -465,33 +568,7 @@ class LitimeBmsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     def _offline_data(self) -> dict[str, Any]:
         """Return offline data with all values set to None."""
-        return {
-            "online": False,
-            "total_voltage": None,
-            "current": None,
-            "power": None,
-            "state_of_charge": None,
-            "state_of_health": None,
-            "cell_temperature": None,
-            "mosfet_temperature": None,
-            "remaining_capacity": None,
-            "full_charge_capacity": None,
-            "discharge_cycles": None,
-            "total_discharge_ah": None,
-            "min_cell_voltage": None,
-            "max_cell_voltage": None,
-            "delta_cell_voltage": None,
-            "cell_voltages": [None] * MAX_CELLS,
-            "charging": None,
-            "discharging": None,
-            "balancing": None,
-            "charge_enabled": None,
-            "discharge_enabled": None,
-            "protection_status": None,
-            "failure_status": None,
-            "estimate_15_soc_time": None,
-            "remaining_time_hours": None,
-        }
+        return _OFFLINE_DATA.copy()
 
     async def async_set_charging(self, enabled: bool) -> None:
         """Enable or disable charging."""
@@ -25,7 +25,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MAX_CELLS
+from .const import MAX_CELLS
 from .coordinator import LitimeBmsCoordinator
 
 UNIT_AMPERE_HOURS = "Ah"
@@ -196,6 +196,16 @@ SENSOR_DESCRIPTIONS: tuple[LitimeSensorEntityDescription, ...] = (
 )
 
 
+def _cell_voltage(data: dict[str, Any], cell_index: int) -> float | None:
+    """Return a cell voltage, or None if the cell is not populated."""
+    cell_voltages = data.get("cell_voltages")
+    if not cell_voltages:
+        return None
+    voltage = cell_voltages[cell_index]
+    # Unpopulated cells are NaN in parsed data and None in offline data
+    return voltage if voltage == voltage else None
+
+
 def _make_cell_voltage_description(
     cell_index: int,
 ) -> LitimeSensorEntityDescription:
@@ -207,12 +217,15 @@ def _make_cell_voltage_description(
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=3,
-        value_fn=lambda data, idx=cell_index: (
-            data.get("cell_voltages", [None] * MAX_CELLS)[idx]
-        ),
+        value_fn=lambda data, idx=cell_index: _cell_voltage(data, idx),
     )
 
 
+CELL_VOLTAGE_DESCRIPTIONS: tuple[LitimeSensorEntityDescription, ...] = tuple(
+    _make_cell_voltage_description(i) for i in range(MAX_CELLS)
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -221,18 +234,11 @@ async def async_setup_entry(
     """Set up LiTime BMS sensors."""
     coordinator: LitimeBmsCoordinator = entry.runtime_data
 
-    entities: list[LitimeSensorEntity] = []
-
-    # Add all standard sensors
-    for description in SENSOR_DESCRIPTIONS:
-        entities.append(LitimeSensorEntity(coordinator, description, entry))
-
-    # Add cell voltage sensors (only for cells that have data)
-    for i in range(MAX_CELLS):
-        description = _make_cell_voltage_description(i)
-        entities.append(LitimeSensorEntity(coordinator, description, entry))
-
-    async_add_entities(entities)
+    # Standard sensors followed by one voltage sensor per cell
+    async_add_entities(
+        LitimeSensorEntity(coordinator, description, entry)
+        for description in (*SENSOR_DESCRIPTIONS, *CELL_VOLTAGE_DESCRIPTIONS)
+    )
 
 
 class LitimeSensorEntity(CoordinatorEntity[LitimeBmsCoordinator], SensorEntity):
@@ -251,20 +257,16 @@ class LitimeSensorEntity(CoordinatorEntity[LitimeBmsCoordinator], SensorEntity):
         super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{entry.unique_id}_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.unique_id or entry.entry_id)},
-            "name": coordinator.device_name,
-            "manufacturer": "LiTime",
-            "model": "LiFePO4 BMS",
-            "connections": {("bluetooth", coordinator.address)},
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> Any:
         """Return the sensor value."""
-        if self.coordinator.data is None:
+        data = self.coordinator.data
+        # Offline data holds no values, skip the lookup entirely
+        if not data or data.get("online") is False:
             return None
-        return self.entity_description.value_fn(self.coordinator.data)
+        return self.entity_description.value_fn(data)
 
     @property
     def available(self) -> bool:
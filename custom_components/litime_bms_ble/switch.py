@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Coroutine
 from dataclasses import dataclass
+from itertools import chain
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
@@ -12,7 +13,6 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
 from .coordinator import LitimeBmsCoordinator
 
 
@@ -20,7 +20,7 @@ from .coordinator import LitimeBmsCoordinator
 class LitimeSwitchEntityDescription(SwitchEntityDescription):
     """Description of a LiTime switch entity."""
 
-    value_fn: Callable[[dict[str, Any]], bool | None]
+    data_key: str
     turn_on_fn: Callable[[LitimeBmsCoordinator], Coroutine[Any, Any, None]]
     turn_off_fn: Callable[[LitimeBmsCoordinator], Coroutine[Any, Any, None]]
 
@@ -30,7 +30,7 @@ SWITCH_DESCRIPTIONS: tuple[LitimeSwitchEntityDescription, ...] = (
         key="charging_switch",
         translation_key="charging_switch",
         icon="mdi:battery-charging",
-        value_fn=lambda data: data.get("charge_enabled"),
+        data_key="charge_enabled",
         turn_on_fn=lambda coord: coord.async_set_charging(True),
         turn_off_fn=lambda coord: coord.async_set_charging(False),
     ),
@@ -38,7 +38,7 @@ SWITCH_DESCRIPTIONS: tuple[LitimeSwitchEntityDescription, ...] = (
         key="discharging_switch",
         translation_key="discharging_switch",
         icon="mdi:battery-arrow-down-outline",
-        value_fn=lambda data: data.get("discharge_enabled"),
+        data_key="discharge_enabled",
         turn_on_fn=lambda coord: coord.async_set_discharging(True),
         turn_off_fn=lambda coord: coord.async_set_discharging(False),
     ),
@@ -52,14 +52,19 @@ async def async_setup_entry(
 ) -> None:
     """Set up LiTime BMS switches."""
     coordinator: LitimeBmsCoordinator = entry.runtime_data
+    unique_id_prefix = entry.unique_id
 
-    entities: list[SwitchEntity] = [
-        LitimeSwitchEntity(coordinator, description, entry)
-        for description in SWITCH_DESCRIPTIONS
-    ]
-    entities.append(LitimeConnectionSwitch(coordinator, entry))
-
-    async_add_entities(entities)
+    async_add_entities(
+        chain(
+            (
+                LitimeSwitchEntity(
+                    coordinator, description, f"{unique_id_prefix}_{description.key}"
+                )
+                for description in SWITCH_DESCRIPTIONS
+            ),
+            (LitimeConnectionSwitch(coordinator, f"{unique_id_prefix}_connection"),),
+        )
+    )
 
 
 class LitimeSwitchEntity(CoordinatorEntity[LitimeBmsCoordinator], SwitchEntity):
@@ -72,26 +77,20 @@ class LitimeSwitchEntity(CoordinatorEntity[LitimeBmsCoordinator], SwitchEntity):
         self,
         coordinator: LitimeBmsCoordinator,
         description: LitimeSwitchEntityDescription,
-        entry: ConfigEntry,
+        unique_id: str,
     ) -> None:
         """Initialize the switch."""
         super().__init__(coordinator)
         self.entity_description = description
-        self._attr_unique_id = f"{entry.unique_id}_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.unique_id or entry.entry_id)},
-            "name": coordinator.device_name,
-            "manufacturer": "LiTime",
-            "model": "LiFePO4 BMS",
-            "connections": {("bluetooth", coordinator.address)},
-        }
+        self._data_key = description.data_key
+        self._attr_unique_id = unique_id
+        self._attr_device_info = coordinator.device_info
 
     @property
     def is_on(self) -> bool | None:
         """Return the switch state."""
-        if self.coordinator.data is None:
-            return None
-        return self.entity_description.value_fn(self.coordinator.data)
+        data = self.coordinator.data
+        return None if data is None else data.get(self._data_key)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
@@ -106,9 +105,8 @@ class LitimeSwitchEntity(CoordinatorEntity[LitimeBmsCoordinator], SwitchEntity):
         """Return True if entity is available."""
         if not super().available:
             return False
-        if self.coordinator.data is None:
-            return False
-        return self.coordinator.data.get("online", False)
+        data = self.coordinator.data
+        return data is not None and data.get("online", False)
 
 
 class LitimeConnectionSwitch(CoordinatorEntity[LitimeBmsCoordinator], SwitchEntity):
@@ -121,18 +119,12 @@ class LitimeConnectionSwitch(CoordinatorEntity[LitimeBmsCoordinator], SwitchEnti
     def __init__(
         self,
         coordinator: LitimeBmsCoordinator,
-        entry: ConfigEntry,
+        unique_id: str,
     ) -> None:
         """Initialize the connection switch."""
         super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.unique_id}_connection"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.unique_id or entry.entry_id)},
-            "name": coordinator.device_name,
-            "manufacturer": "LiTime",
-            "model": "LiFePO4 BMS",
-            "connections": {("bluetooth", coordinator.address)},
-        }
+        self._attr_unique_id = unique_id
+        self._attr_device_info = coordinator.device_info
 
     @property
     def is_on(self) -> bool: